@@ -1,10 +1,14 @@
 """Apex Legends Prometheus Exporter"""
 
+import asyncio
 import logging
 import os
 import sys
+import threading
 import time
-import requests
+from typing import Any
+import aiohttp
+import msgspec
 from prometheus_client import (
     start_http_server,
     Gauge,
@@ -16,13 +20,22 @@ from prometheus_client import (
     Info,
 )
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 class MapDataCollector:
     """Class to collect map data"""
 
     URL = "https://api.mozambiquehe.re/maprotation"
 
     def __init__(
-        self, api_key: str, uid: str = None, player_name: str = None
+        self,
+        api_key: str,
+        uid: str = None,
+        player_name: str = None,
+        session: aiohttp.ClientSession = None,
     ):
         """
         Initialize the MapDataCollector instance.
@@ -31,10 +44,15 @@ class MapDataCollector:
         api_key (str): The API key for authorization.
         uid (str, optional): The user ID. Defaults to None.
         player_name (str, optional): The player's name. Defaults to None.
+        session (aiohttp.ClientSession, optional): Session shared with the other collectors. Defaults to None.
         """
         self.uid = uid
         self.player_name = player_name
         self.headers = {"Authorization": api_key}
+        self.session = session
+
+        # Cached rotation as (expiry, fetched_at, response), using the monotonic clock
+        self._cache = (0.0, 0.0, None)
 
         # Data from current map rotation
         self.current_map_name = ""
@@ -47,16 +65,29 @@ class MapDataCollector:
         self.next_map_start = 0
         self.next_map_duration = 0
 
-    def populate_data(self):
+    async def populate_data(self):
         """
         Collect map data from the API and populate the instance variables.
+
+        The rotation only changes when the current map ends, so the response is
+        cached until then and the remaining time is derived from the cache.
         """
-        logging.debug("Collecting from: %s", self.URL)
-        logging.debug("API KEY: %s", self.headers["Authorization"])
+        now = time.monotonic()
+        expiry, fetched_at, map_rotation = self._cache
+
+        if now >= expiry:
+            logging.debug("Collecting from: %s", self.URL)
+            logging.debug("API KEY: %s", self.headers["Authorization"])
 
-        map_rotation = requests.get(
-            self.URL, headers=self.headers, timeout=10
-        ).json()
+            async with self.session.get(self.URL, headers=self.headers) as response:
+                logging.debug("Content-Encoding: %s", response.headers.get("Content-Encoding"))
+                map_rotation = json_loads(await response.read())
+
+            fetched_at = now
+            expiry = now + map_rotation["current"]["remainingMins"] * 60
+            self._cache = (expiry, fetched_at, map_rotation)
+        else:
+            logging.debug("Using cached map rotation for %d more seconds", expiry - now)
 
         current_map_data = map_rotation["current"]
         next_map_data = map_rotation["next"]
@@ -67,22 +98,119 @@ class MapDataCollector:
         self.current_map_duration = current_map_data["DurationInMinutes"]
         self.next_map_duration = next_map_data["DurationInMinutes"]
 
-        self.current_map_remaining = current_map_data["remainingMins"]
+        self.current_map_remaining = max(
+            0, current_map_data["remainingMins"] - int((now - fetched_at) // 60)
+        )
         self.next_map_start = next_map_data["start"]
 
         self.current_map_image = current_map_data["asset"]
 
+# Schema of the parts of the bridge response read by PlayerStatsCollector, other fields are ignored.
+# Values missing from the response decode to None, so their metrics are not exported.
+class Bans(msgspec.Struct):
+    """Ban status of the player"""
+
+    isActive: bool | None = None
+    remainingSeconds: int | None = None
+
+class Rank(msgspec.Struct):
+    """BR or Arena rank of the player"""
+
+    rankName: str | None = None
+    rankScore: int | None = None
+    rankDiv: int | None = None
+
+class BattlePass(msgspec.Struct):
+    """Battle Pass progress of the player"""
+
+    level: Any = None
+    history: Any = None
+
+class GlobalStats(msgspec.Struct):
+    """Global stats of the player"""
+
+    name: str | None = None
+    platform: str | None = None
+    level: int | None = None
+    toNextLevelPercent: float | None = None
+    bans: Bans = msgspec.field(default_factory=Bans)
+    rank: Rank = msgspec.field(default_factory=Rank)
+    arena: Rank = msgspec.field(default_factory=Rank)
+    battlepass: BattlePass = msgspec.field(default_factory=BattlePass)
+
+class Realtime(msgspec.Struct):
+    """Realtime state of the player"""
+
+    lobbyState: str | None = None
+    isOnline: int | bool | None = None
+    isInGame: int | bool | None = None
+    partyFull: int | bool | None = None
+    selectedLegend: str | None = None
+    currentState: str | None = None
+
+class Tracker(msgspec.Struct):
+    """A single legend tracker, e.g. BR kills"""
+
+    key: str = ""
+    value: Any = 0
+
+class LegendStats(msgspec.Struct):
+    """Trackers of a legend, which can be null"""
+
+    LegendName: str | None = None
+    data: list[Tracker] | None = None
+
+class Legends(msgspec.Struct):
+    """Selected legend and all legends of the player"""
+
+    selected: LegendStats = msgspec.field(default_factory=LegendStats)
+    all: dict[str, LegendStats] = {}
+
+class TotalValue(msgspec.Struct):
+    """A single total across all legends"""
+
+    value: Any = None
+
+class Total(msgspec.Struct):
+    """Totals across all legends"""
+
+    kills: TotalValue = msgspec.field(default_factory=TotalValue)
+    kd: TotalValue = msgspec.field(default_factory=TotalValue)
+
+class MozambiqueInternal(msgspec.Struct):
+    """Internal data of the API"""
+
+    clusterSrv: str | None = None
+
+class BridgeResponse(msgspec.Struct):
+    """Response of the bridge endpoint"""
+
+    # Required, so an error body such as {"Error": "..."} fails to decode
+    global_: GlobalStats = msgspec.field(name="global")
+    realtime: Realtime
+    legends: Legends
+    total: Total
+    mozambiquehere_internal: MozambiqueInternal = msgspec.field(
+        default_factory=MozambiqueInternal
+    )
+    processingTime: float | None = None
+
 class PlayerStatsCollector:
     """Class to collect player stats"""
 
     URL = "https://api.mozambiquehe.re/bridge"
 
+    # Decodes straight into the structs above, without building the full dict.
+    # Non-strict, so numeric strings still coerce to numbers.
+    DECODER = msgspec.json.Decoder(BridgeResponse, strict=False)
+
     def __init__(
         self,
         api_key: str,
         uid: str = None,
         player_name: str = None,
         platform: str = None,
+        session: aiohttp.ClientSession = None,
     ):
         """Initialize the PlayerStatsCollector.
 
@@ -91,11 +219,19 @@ class PlayerStatsCollector:
         uid (str, optional): The unique identifier for the player. Defaults to None.
         player_name (str, optional): The player's name. Defaults to None.
         platform (str, optional): The platform the player plays on. Defaults to None.
+        session (aiohttp.ClientSession, optional): Session shared with the other collectors. Defaults to None.
         """
         self.uid = uid
         self.platform = platform
         self.player_name = player_name
         self.headers = {"Authorization": api_key}
+        self.session = session
+
+        # Query parameters for the bridge endpoint, which never change
+        if self.player_name:
+            self._params = {"player": self.player_name, "platform": self.platform}
+        else:
+            self._params = {"uid": self.uid, "platform": self.platform}
 
         # TODO: Convert to dictionary and/or properties
         """
@@ -117,7 +253,7 @@ class PlayerStatsCollector:
         self.player_platform = ""
         self.level = 0
         self.next_level_percentage = 0
-        self.banned = ""
+        self.banned = False
         self.ban_duration = 0
 
         # Data from BR Ranking
@@ -136,8 +272,8 @@ class PlayerStatsCollector:
 
         # Data from Realtime
         self.lobby_state = ""
-        self.is_online = False
-        self.is_in_game = False
+        self.is_online = 0
+        self.is_in_game = 0
         self.party_full = False
         self.selected_legend = ""
         self.current_state = ""
@@ -151,7 +287,7 @@ class PlayerStatsCollector:
 
         # Data from Player Total
         self.kills = 0
-        self.kill_death_ratio = ""
+        self.kill_death_ratio = 0.0
 
         # Data from Mozambique
         self.mozambique_cluster_server = ""
@@ -159,102 +295,95 @@ class PlayerStatsCollector:
         # Data from API
         self.processing_time = 0
 
-    def populate_data(self):
+    async def populate_data(self):
         """
         Populates data from the API and assigns various player stats and information to instance variables.
         """
         logging.debug("Collecting from: %s", self.URL)
         logging.debug("API KEY: %s", self.headers["Authorization"])
 
-        if self.player_name:
-            player_stats = requests.get(
-                self.URL,
-                headers=self.headers,
-                params={"player": self.player_name, "platform": self.platform},
-                timeout=10,
-            ).json()
-        else:
-            player_stats = requests.get(
-                self.URL,
-                headers=self.headers,
-                params={"uid": self.uid, "platform": self.platform},
-                timeout=10,
-            ).json()
-
-        player_info_data = player_stats["global"]
-        player_realtime_data = player_stats["realtime"]
-        player_current_legend_data = player_stats["legends"]["selected"]
-        player_legends_kills = player_stats["legends"]["all"]
-        player_mozambique_data = player_stats["mozambiquehere_internal"]
-        player_total_data = player_stats["total"]
-        api_data = player_stats["processingTime"]
+        async with self.session.get(
+            self.URL, headers=self.headers, params=self._params
+        ) as response:
+            logging.debug("Content-Encoding: %s", response.headers.get("Content-Encoding"))
+            response.raise_for_status()
+            player_stats = self.DECODER.decode(await response.read())
+
+        player_info_data = player_stats.global_
+        player_realtime_data = player_stats.realtime
+        player_current_legend_data = player_stats.legends.selected
+        player_legends_kills = player_stats.legends.all
+        player_mozambique_data = player_stats.mozambiquehere_internal
+        player_total_data = player_stats.total
+        api_data = player_stats.processingTime
 
         # Data from global stats
-        self.player_identifier = player_info_data["name"]
-        self.player_platform = player_info_data["platform"]
-        self.level = player_info_data["level"]
-        self.next_level_percentage = player_info_data["toNextLevelPercent"]
-        self.banned = player_info_data["bans"]["isActive"]
-        self.ban_duration = player_info_data["bans"]["remainingSeconds"]
+        self.player_identifier = player_info_data.name
+        self.player_platform = player_info_data.platform
+        self.level = player_info_data.level
+        self.next_level_percentage = player_info_data.toNextLevelPercent
+        self.banned = player_info_data.bans.isActive
+        self.ban_duration = player_info_data.bans.remainingSeconds
 
         # Data from BR Ranking
-        self.br_rank_name = player_info_data["rank"]["rankName"]
-        self.br_rank_score = player_info_data["rank"]["rankScore"]
-        self.br_rank_div = player_info_data["rank"]["rankDiv"]
+        self.br_rank_name = player_info_data.rank.rankName
+        self.br_rank_score = player_info_data.rank.rankScore
+        self.br_rank_div = player_info_data.rank.rankDiv
 
         # Data from Arena Rank
-        self.arena_rank_name = player_info_data["arena"]["rankName"]
-        self.arena_rank_score = player_info_data["arena"]["rankScore"]
-        self.arena_rank_div = player_info_data["arena"]["rankDiv"]
+        self.arena_rank_name = player_info_data.arena.rankName
+        self.arena_rank_score = player_info_data.arena.rankScore
+        self.arena_rank_div = player_info_data.arena.rankDiv
 
         # Data from BattlePass
-        self.battle_pass_level = player_info_data["battlepass"]["level"] or 0
-        self.battle_pass_history = player_info_data["battlepass"]["history"] or 0
+        battle_pass_level = player_info_data.battlepass.level
+        battle_pass_history = player_info_data.battlepass.history
+        self.battle_pass_level = None if battle_pass_level is None else battle_pass_level or 0
+        self.battle_pass_history = None if battle_pass_history is None else battle_pass_history or 0
 
         # Data from Realtime
-        self.lobby_state = player_realtime_data["lobbyState"]
-        self.is_online = bool(player_realtime_data["isOnline"])
-        self.is_in_game = bool(player_realtime_data["isInGame"])
-        self.party_full = bool(player_realtime_data["partyFull"])
-        self.selected_legend = player_realtime_data["selectedLegend"]
-        self.current_state = player_realtime_data["currentState"]
+        self.lobby_state = player_realtime_data.lobbyState
+        is_online = player_realtime_data.isOnline
+        is_in_game = player_realtime_data.isInGame
+        self.is_online = None if is_online is None else (1 if is_online else 0)
+        self.is_in_game = None if is_in_game is None else (1 if is_in_game else 0)
+        party_full = player_realtime_data.partyFull
+        self.party_full = None if party_full is None else bool(party_full)
+        self.selected_legend = player_realtime_data.selectedLegend
+        self.current_state = player_realtime_data.currentState
 
         # Data from Current Legend
-        self.current_legend_name = player_current_legend_data["LegendName"]
+        self.current_legend_name = player_current_legend_data.LegendName
 
         # This data can sometimes return null
-        if not player_current_legend_data["data"]:
+        if not player_current_legend_data.data:
             self.current_legend_br_kills = 0
         else:
-            self.current_legend_br_kills = player_current_legend_data["data"][0]["value"]
+            self.current_legend_br_kills = player_current_legend_data.data[0].value
 
         # Data from All Legends
-        self.all_legends_kills = {}
+        all_legends_kills = {}
 
-        # Generator Expression to extract kill value from all legends
+        # Index each legend's trackers by key once to look up the kill value
         for legend_name, legend_info in player_legends_kills.items():
             if legend_name == "Global":
                 continue  # skip
-            if "data" not in legend_info:
-                # alternative: if not legend_info.get('data'):
+            legend_data = legend_info.data
+            if not legend_data:
                 continue
-            kill_value = next(
-                (
-                    item["value"]
-                    for item in legend_info["data"]
-                    if item["key"] == "kills"
-                ),
-                0,
-            )
-            if kill_value != 0:
-                self.all_legends_kills[legend_name] = kill_value
+            kill_value = {item.key: item.value for item in legend_data}.get("kills", 0)
+            if kill_value:
+                all_legends_kills[legend_name] = kill_value
+
+        self.all_legends_kills = all_legends_kills
 
         # Data from Player Total
-        self.kills = player_total_data["kills"]["value"]
-        self.kill_death_ratio = float(player_total_data["kd"]["value"])
+        self.kills = player_total_data.kills.value
+        kill_death_ratio = player_total_data.kd.value
+        self.kill_death_ratio = None if kill_death_ratio is None else float(kill_death_ratio)
 
         # Data from Mozambique
-        self.mozambique_cluster_server = player_mozambique_data["clusterSrv"]
+        self.mozambique_cluster_server = player_mozambique_data.clusterSrv
 
         # Data from API
         self.processing_time = api_data
@@ -262,6 +391,80 @@ class PlayerStatsCollector:
 class ApexCollector:
     """Class aggregates the data from the collectors and exposes it using Prometheus metrics."""
 
+    # Minimum number of seconds between two refreshes of the API data
+    MIN_INTERVAL = 25
+
+    # Player stats Info metrics as (name, description, attribute, info label)
+    INFO_METRICS = [
+        ("apex_player_identifier", "Name of the player", "player_identifier", "player"),
+        ("apex_player_platform", "Platform of the player", "player_platform", "platform"),
+        ("apex_player_banned", "Is the player banned", "banned", "banned"),
+        ("apex_player_br_rank_name", "BR Rank Name of the player", "br_rank_name", "rank_name"),
+        (
+            "apex_player_arena_rank_name",
+            "Arena Rank Name of the player",
+            "arena_rank_name",
+            "rank_name",
+        ),
+        # TODO: convert to ENUM
+        ("apex_player_lobby_state", "Lobby state of the player", "lobby_state", "state"),
+        ("apex_player_party_full", "Is the player in a party", "party_full", "party_full"),
+        (
+            "apex_player_selected_legend",
+            "Name of the selected legend",
+            "selected_legend",
+            "legend_name",
+        ),
+        (
+            "apex_player_active_legend",
+            "Name of the active legend",
+            "current_legend_name",
+            "legend_name",
+        ),
+        ("apex_player_current_state", "Current state of the player", "current_state", "state"),
+        (
+            "apex_player_mozambique_cluster_server",
+            "Cluster name presenting API",
+            "mozambique_cluster_server",
+            "mozambique_cluster_server",
+        ),
+    ]
+
+    # Player stats Gauge metrics as (name, description, attribute)
+    GAUGE_METRICS = [
+        ("apex_player_level", "Level of the player", "level"),
+        (
+            "apex_player_next_level_percentage",
+            "Next level percentage of the player",
+            "next_level_percentage",
+        ),
+        ("apex_player_ban_duration", "Ban duration of the player", "ban_duration"),
+        ("apex_player_br_rank_score", "BR Rank Score of the player", "br_rank_score"),
+        ("apex_player_br_rank_div", "BR Rank Division of the player", "br_rank_div"),
+        ("apex_player_arena_rank_score", "Arena Rank Score of the player", "arena_rank_score"),
+        ("apex_player_arena_rank_div", "Arena Rank Division of the player", "arena_rank_div"),
+        (
+            "apex_player_battle_pass_level",
+            "Battle Pass Level of the player",
+            "battle_pass_level",
+        ),
+        (
+            "apex_player_battle_pass_history",
+            "Battle Pass History of the player",
+            "battle_pass_history",
+        ),
+        ("apex_player_is_online", "Is the player online", "is_online"),
+        ("apex_player_is_in_game", "Is the player in a game", "is_in_game"),
+        (
+            "apex_player_active_legend_kills",
+            "Total kills of the active legend",
+            "current_legend_br_kills",
+        ),
+        ("apex_player_kills_total", "Total kills of the player", "kills"),
+        ("apex_player_kill_death_ratio", "Kill/Death Ratio of the player", "kill_death_ratio"),
+        ("apex_player_processing_time", "API Processing Time in milliseconds", "processing_time"),
+    ]
+
     def __init__(
         self,
         player_stats_collector: PlayerStatsCollector,
@@ -270,254 +473,218 @@ class ApexCollector:
     ):
         """
         Initializes the class with the player_stats_collector, map_stats_collector, and optional registry. 
+
+        Must be called from the event loop the collectors' session runs on.
         """
-        self.registry = registry
+        # Metrics are not registered themselves; they are yielded by collect()
 
         # Define Prometheus metrics for map stats
         self.current_session_map = Info(
-            "apex_current_map", "Name of the current map", registry=registry
+            "apex_current_map", "Name of the current map", registry=None
         )
 
         self.current_session_duration = Gauge(
             "apex_current_map_duration_total",
             "Duration of the current map in minutes",
-            registry=registry,
+            registry=None,
         )
 
         self.current_session_remaining = Gauge(
             "apex_current_map_remaining_total",
             "Time remaining of the current map in minutes",
-            registry=registry,
+            registry=None,
         )
 
         self.current_session_image = Info(
             "apex_current_map_image",
             "Image of the current map",
-            registry=registry,
+            registry=None,
         )
 
         self.next_session_map = Info(
-            "apex_next_map", "Name of the next map", registry=registry
+            "apex_next_map", "Name of the next map", registry=None
         )
 
         self.next_session_start = Gauge(
             "apex_next_map_start_total",
             "Seconds until the next map starts",
-            registry=registry,
+            registry=None,
         )
 
         self.next_session_duration = Gauge(
             "apex_next_map_duration_minutes",
             "Duration of the next map in minutes",
-            registry=registry,
+            registry=None,
         )
 
         # Define Prometheus Metrics for Player Stats
-        self.player_identifier = Info(
-            "apex_player_identifier", "Name of the player", registry=registry
-        )
-
-        self.player_platform = Info(
-            "apex_player_platform", "Platform of the player", registry=registry
-        )
-
-        self.level = Gauge("apex_player_level", "Level of the player", registry=registry)
-
-        self.next_level_percentage = Gauge(
-            "apex_player_next_level_percentage",
-            "Next level percentage of the player",
-            registry=registry,
-        )
-
-        self.banned = Info("apex_player_banned", "Is the player banned", registry=registry)
-
-        self.ban_duration = Gauge(
-            "apex_player_ban_duration", "Ban duration of the player", registry=registry
-        )
-
-        self.br_rank_name = Info(
-            "apex_player_br_rank_name", "BR Rank Name of the player", registry=registry
-        )
-
-        self.br_rank_score = Gauge(
-            "apex_player_br_rank_score", "BR Rank Score of the player", registry=registry
-        )
-
-        self.br_rank_div = Gauge(
-            "apex_player_br_rank_div", "BR Rank Division of the player", registry=registry
-        )
-
-        self.arena_rank_name = Info(
-            "apex_player_arena_rank_name", "Arena Rank Name of the player", registry=registry
-        )
-
-        self.arena_rank_score = Gauge(
-            "apex_player_arena_rank_score",
-            "Arena Rank Score of the player",
-            registry=registry,
-        )
-
-        self.arena_rank_div = Gauge(
-            "apex_player_arena_rank_div",
-            "Arena Rank Division of the player",
-            registry=registry,
-        )
-
-        self.battle_pass_level = Gauge(
-            "apex_player_battle_pass_level",
-            "Battle Pass Level of the player",
-            registry=registry,
-        )
-
-        self.battle_pass_history = Gauge(
-            "apex_player_battle_pass_history",
-            "Battle Pass History of the player",
-            registry=registry,
-        )
-
-        self.lobby_state = Info(
-            "apex_player_lobby_state", "Lobby state of the player", registry=registry
-        )
-
-        self.is_online = Gauge(
-            "apex_player_is_online", "Is the player online", registry=registry
-        )
-
-        self.is_in_game = Gauge(
-            "apex_player_is_in_game", "Is the player in a game", registry=registry
-        )
-
-        self.party_full = Info(
-            "apex_player_party_full", "Is the player in a party", registry=registry
-        )
-
-        self.selected_legend = Info(
-            "apex_player_selected_legend", "Name of the selected legend", registry=registry
-        )
-
-        self.active_legend = Info(
-            "apex_player_active_legend", "Name of the active legend", registry=registry
-        )
-
-        self.active_legend_kills = Gauge(
-            "apex_player_active_legend_kills",
-            "Total kills of the active legend",
-            registry=registry,
-        )
-
-        self.current_state = Info(
-            "apex_player_current_state", "Current state of the player", registry=registry
-        )
-
         self.legend_kills = Gauge(
             "apex_player_legend_kills",
             "Total kills for each legend",
             ["legend_name"],
-            registry=registry,
-        )
-
-        self.kills = Gauge(
-            "apex_player_kills_total", "Total kills of the player", registry=registry
+            registry=None,
         )
 
-        self.kill_death_ratio = Gauge(
-            "apex_player_kill_death_ratio",
-            "Kill/Death Ratio of the player",
-            registry=registry,
-        )
+        # Labelled children of legend_kills, keyed by legend name
+        self._legend_kill_children = {}
+        self._last_legends_kills = {}
 
-        self.mozambique_cluster_server = Info(
-            "apex_player_mozambique_cluster_server",
-            "Cluster name presenting API",
-            registry=registry,
+        self.collect_duration = Gauge(
+            "apex_collect_duration_seconds",
+            "Time taken to refresh the data from the API in seconds",
+            registry=None,
         )
 
-        self.processing_time = Gauge(
-            "apex_player_processing_time",
-            "API Processing Time in milliseconds",
-            registry=registry,
+        self.last_refresh_success = Gauge(
+            "apex_last_refresh_success",
+            "Whether the last refresh from the API succeeded",
+            registry=None,
         )
 
         self.player_stats_collector = player_stats_collector
 
         self.map_stats_collector = map_stats_collector
 
+        self._static_metrics = [
+            value for value in vars(self).values() if isinstance(value, (Gauge, Info))
+        ]
+
+        # Player stats metrics, created the first time their field is in the response
+        self._metrics = {}
+
+        # Scrapes arrive on the HTTP server's threads, refreshes run on this loop
+        self._loop = asyncio.get_running_loop()
+        self._lock = threading.Lock()
+        self._last_refresh = float("-inf")
+
+        registry.register(self)
+
+    def describe(self):
+        """
+        Describes every metric this collector can yield, without refreshing the data,
+        so the registry can map their names to it and detect duplicates.
+        """
+        for metric in self._static_metrics:
+            yield from metric.describe()
+        for name, doc, _, _ in self.INFO_METRICS:
+            yield from Info(name, doc, registry=None).describe()
+        for name, doc, _ in self.GAUGE_METRICS:
+            yield from Gauge(name, doc, registry=None).describe()
+
     def collect(self):
+        """
+        Refreshes the data when it is older than MIN_INTERVAL, then yields the
+        Prometheus metrics. Called by the registry on every scrape.
+        """
+        # Concurrent scrapes wait for a single refresh instead of starting their own
+        with self._lock:
+            started = time.monotonic()
+            # Measured from the start of the last refresh so API latency does not stretch the interval
+            if started - self._last_refresh >= self.MIN_INTERVAL:
+                # On failure keep serving the last values and retry after MIN_INTERVAL
+                try:
+                    asyncio.run_coroutine_threadsafe(self._refresh(), self._loop).result()
+                except Exception:
+                    logging.exception("Failed to refresh data from the API")
+                    self.last_refresh_success.set(0)
+                else:
+                    self.last_refresh_success.set(1)
+                self._last_refresh = started
+                self.collect_duration.set(time.monotonic() - started)
+
+            # Snapshot, as a later refresh may create metrics while this scrape is rendered
+            metrics = [*self._static_metrics, *self._metrics.values()]
+
+        for metric in metrics:
+            yield from metric.collect()
+
+    def _get_or_create_gauge(self, name: str, doc: str) -> Gauge:
+        """
+        Returns the player stats Gauge with the given name, creating it on first use.
+        """
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Gauge(name, doc, registry=None)
+        return metric
+
+    def _get_or_create_info(self, name: str, doc: str) -> Info:
+        """
+        Returns the player stats Info with the given name, creating it on first use.
+        """
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Info(name, doc, registry=None)
+        return metric
+
+    async def _refresh(self):
         """
         Collects and populates various player and map statistics, and
         defines Prometheus metrics for map and player stats.
         """
-        self.player_stats_collector.populate_data()
-        self.map_stats_collector.populate_data()
+        player_stats = self.player_stats_collector
+        map_stats = self.map_stats_collector
 
-        # Improve readability by variablizing the map name
-        current_map_name = self.map_stats_collector.current_map_name
-        next_map_name = self.map_stats_collector.next_map_name
+        # Both endpoints are independent, so fetch them concurrently
+        await asyncio.gather(player_stats.populate_data(), map_stats.populate_data())
 
         # Define Prometheus Metrics for Map Stats
-        self.current_session_map.info({"map_name": current_map_name})
-        self.current_session_duration.set(self.map_stats_collector.current_map_duration)
-        self.current_session_remaining.set(self.map_stats_collector.current_map_remaining)
-        self.current_session_image.info({"image": self.map_stats_collector.current_map_image})
-        self.next_session_map.info({"map_name": next_map_name})
-        self.next_session_duration.set(self.map_stats_collector.next_map_duration)
-        self.next_session_start.set(self.map_stats_collector.next_map_start - int(time.time()))
-
-        # Define Prometheus Metrics for Player Stats
-        self.player_identifier.info(
-            {"player": self.player_stats_collector.player_identifier}
-        )
-        self.player_platform.info(
-            {"platform": self.player_stats_collector.player_platform}
-        )
-        self.level.set(self.player_stats_collector.level)
-        self.next_level_percentage.set(
-            self.player_stats_collector.next_level_percentage
-        )
-        self.banned.info({"banned": str(self.player_stats_collector.banned)})
-        self.ban_duration.set(self.player_stats_collector.ban_duration)
-        self.br_rank_name.info(
-            {"rank_name": self.player_stats_collector.br_rank_name}
-        )
-        self.br_rank_score.set(self.player_stats_collector.br_rank_score)
-        self.br_rank_div.set(self.player_stats_collector.br_rank_div)
-        self.arena_rank_name.info(
-            {"rank_name": self.player_stats_collector.arena_rank_name}
-        )
-        self.arena_rank_score.set(self.player_stats_collector.arena_rank_score)
-        self.arena_rank_div.set(self.player_stats_collector.arena_rank_div)
-        self.battle_pass_level.set(self.player_stats_collector.battle_pass_level)
-        self.battle_pass_history.set(self.player_stats_collector.battle_pass_history)
-        self.lobby_state.info(
-            {"state": self.player_stats_collector.lobby_state}
-        )  # TODO: convert to ENUM
-        self.is_online.set(int(self.player_stats_collector.is_online))
-        self.is_in_game.set(int(self.player_stats_collector.is_in_game))
-        self.party_full.info(
-            {"party_full": str(self.player_stats_collector.party_full)}
-        )
-        self.selected_legend.info(
-            {"legend_name": self.player_stats_collector.selected_legend}
-        )
-        self.active_legend.info(
-            {"legend_name": self.player_stats_collector.current_legend_name}
-        )
-        self.active_legend_kills.set(
-            self.player_stats_collector.current_legend_br_kills
-        )
-        self.current_state.info(
-            {"state": self.player_stats_collector.current_state}
-        )
-        for legend_name, kills in self.player_stats_collector.all_legends_kills.items():
-            self.legend_kills.labels(legend_name).set(kills)
-        self.kills.set(self.player_stats_collector.kills)
-        self.kill_death_ratio.set(float(self.player_stats_collector.kill_death_ratio))
-        self.mozambique_cluster_server.info(
-            {
-                "mozambique_cluster_server": self.player_stats_collector.mozambique_cluster_server
-            }
-        )
-        self.processing_time.set(self.player_stats_collector.processing_time)
+        self.current_session_map.info({"map_name": map_stats.current_map_name})
+        self.current_session_duration.set(map_stats.current_map_duration)
+        self.current_session_remaining.set(map_stats.current_map_remaining)
+        self.current_session_image.info({"image": map_stats.current_map_image})
+        self.next_session_map.info({"map_name": map_stats.next_map_name})
+        self.next_session_duration.set(map_stats.next_map_duration)
+        self.next_session_start.set(map_stats.next_map_start - int(time.time()))
+
+        # Define Prometheus Metrics for Player Stats, skipping fields missing from the response
+        for name, doc, attr, key in self.INFO_METRICS:
+            value = getattr(player_stats, attr)
+            if value is not None:
+                self._get_or_create_info(name, doc).info({key: str(value)})
+        for name, doc, attr in self.GAUGE_METRICS:
+            value = getattr(player_stats, attr)
+            if value is not None:
+                self._get_or_create_gauge(name, doc).set(value)
+
+        # Legend kills rarely change between refreshes
+        all_legends_kills = player_stats.all_legends_kills
+        if all_legends_kills != self._last_legends_kills:
+            legend_kill_children = self._legend_kill_children
+            for legend_name, kills in all_legends_kills.items():
+                child = legend_kill_children.get(legend_name)
+                if child is None:
+                    child = legend_kill_children[legend_name] = self.legend_kills.labels(legend_name)
+                child.set(kills)
+            self._last_legends_kills = all_legends_kills
+
+async def main(credentials: dict, platform: str):
+    """
+    Creates the shared HTTP session and collectors, then serves metrics forever.
+
+    Args:
+    credentials (dict): The uid, player_name and api_key passed to the collectors.
+    platform (str): The platform the player plays on.
+    """
+    async with aiohttp.ClientSession(
+        # Ask explicitly, in case a proxy strips the default header
+        headers={"Accept-Encoding": "gzip, deflate"},
+        connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60),
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as session:
+        # Pass platform as an argument ONLY to the PlayerStatsCollector
+        player_data = PlayerStatsCollector(
+            **credentials, platform=platform, session=session
+        )
+        map_data = MapDataCollector(**credentials, session=session)
+
+        ApexCollector(player_data, map_data)
+
+        # Serves each scrape on its own thread (ThreadingWSGIServer), so scrapes run
+        # concurrently; one arriving mid-refresh waits for that refresh to finish
+        start_http_server(port=5000)
+
+        # Data is only fetched when scraped, the loop just has to stay alive
+        await asyncio.Event().wait()
 
 if __name__ == "__main__":
     logging.basicConfig(
@@ -546,20 +713,8 @@ if __name__ == "__main__":
         "api_key": os.environ.get("API_KEY"),
     }
 
-    # Pass platform as an argument ONLY to the PlayerStatsCollector
-    player_data = PlayerStatsCollector(
-        **credentials, platform=os.environ.get("PLATFORM", "").upper()
-    )
-    map_data = MapDataCollector(**credentials)
-
     # Unregister default collectors
     for collector in [PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR]:
         REGISTRY.unregister(collector)
 
-    collector = ApexCollector(player_data, map_data)
-
-    start_http_server(port=5000)
-
-    while True:
-        collector.collect()
-        time.sleep(30) # TODO: Collect only when requesting data; modify prometheus_client to do this
+    asyncio.run(main(credentials, os.environ.get("PLATFORM", "").upper()))